@@ -0,0 +1,32 @@
+"""
+Shared fixtures for the Mergington High School Activities API tests
+"""
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app import app, activities
+
+
+@pytest.fixture(scope="session")
+async def client():
+    """Create a single in-process async client shared across the test session"""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def reset_activities():
+    """Reset activities to initial state before each test"""
+    # Only participants are mutated by the endpoints, so only snapshot those
+    original_participants = {
+        k: v["participants"][:] for k, v in activities.items()
+    }
+
+    yield
+
+    # Restore original state in place
+    for key, snapshot in original_participants.items():
+        participants = activities[key]["participants"]
+        participants.clear()
+        participants.extend(snapshot)
@@ -2,66 +2,35 @@
 Tests for the Mergington High School Activities API
 """
 import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
 
-# Add src directory to path so we can import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from app import app, activities
-
-
-@pytest.fixture
-def client():
-    """Create a test client for the app"""
-    return TestClient(app)
-
-
-@pytest.fixture
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    # Save original state
-    original_activities = {
-        k: {
-            "description": v["description"],
-            "schedule": v["schedule"],
-            "max_participants": v["max_participants"],
-            "participants": v["participants"].copy()
-        }
-        for k, v in activities.items()
-    }
-    
-    yield
-    
-    # Restore original state
-    for key in activities:
-        activities[key]["participants"] = original_activities[key]["participants"].copy()
+from app import activities
 
 
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
     
-    def test_get_activities_returns_200(self, client):
+    @pytest.fixture(scope="class")
+    @classmethod
+    async def activities_response(cls, client):
+        """Fetch /activities once and share the response across this class"""
+        return await client.get("/activities")
+    
+    async def test_get_activities_returns_200(self, activities_response):
         """Test that GET /activities returns 200 status code"""
-        response = client.get("/activities")
-        assert response.status_code == 200
+        assert activities_response.status_code == 200
     
-    def test_get_activities_returns_dict(self, client):
+    async def test_get_activities_returns_dict(self, activities_response):
         """Test that GET /activities returns a dictionary"""
-        response = client.get("/activities")
-        assert isinstance(response.json(), dict)
+        assert isinstance(activities_response.json(), dict)
     
-    def test_get_activities_contains_chess_club(self, client):
+    async def test_get_activities_contains_chess_club(self, activities_response):
         """Test that activities list contains Chess Club"""
-        response = client.get("/activities")
-        activities_data = response.json()
+        activities_data = activities_response.json()
         assert "Chess Club" in activities_data
     
-    def test_activity_has_required_fields(self, client):
+    async def test_activity_has_required_fields(self, activities_response):
         """Test that each activity has required fields"""
-        response = client.get("/activities")
-        activities_data = response.json()
+        activities_data = activities_response.json()
         
         for activity_name, activity_data in activities_data.items():
             assert "description" in activity_data
@@ -74,62 +43,48 @@ class TestGetActivities:
 class TestSignup:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
     
-    def test_signup_returns_200(self, client, reset_activities):
-        """Test that signup returns 200 status code"""
-        response = client.post(
-            "/activities/Soccer%20Team/signup?email=newstudent@mergington.edu"
-        )
-        assert response.status_code == 200
-    
-    def test_signup_adds_participant(self, client, reset_activities):
-        """Test that signup adds a participant to the activity"""
+    async def test_signup_happy_path(self, client, reset_activities):
+        """Test that signup returns 200, adds the participant and reports success"""
         email = "newstudent@mergington.edu"
-        response = client.post(
+        response = await client.post(
             f"/activities/Soccer%20Team/signup?email={email}"
         )
         assert response.status_code == 200
         
         # Verify participant was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data["Soccer Team"]["participants"]
-    
-    def test_signup_returns_success_message(self, client, reset_activities):
-        """Test that signup returns appropriate message"""
-        email = "newstudent@mergington.edu"
-        response = client.post(
-            f"/activities/Soccer%20Team/signup?email={email}"
-        )
+        assert email in activities["Soccer Team"]["participants"]
+        
         data = response.json()
         assert "message" in data
         assert email in data["message"]
         assert "Soccer Team" in data["message"]
     
-    def test_signup_nonexistent_activity_returns_404(self, client):
+    async def test_signup_nonexistent_activity_returns_404(self, client):
         """Test that signup to nonexistent activity returns 404"""
-        response = client.post(
+        response = await client.post(
             "/activities/Nonexistent%20Activity/signup?email=test@mergington.edu"
         )
         assert response.status_code == 404
         assert response.json()["detail"] == "Activity not found"
     
-    def test_signup_duplicate_participant_returns_400(self, client, reset_activities):
+    async def test_signup_duplicate_participant_returns_400(self, client, reset_activities):
         """Test that duplicate signup returns 400"""
         email = "michael@mergington.edu"
-        response = client.post(
+        response = await client.post(
             f"/activities/Chess%20Club/signup?email={email}"
         )
         assert response.status_code == 400
         assert "already signed up" in response.json()["detail"]
     
-    def test_signup_full_activity_returns_400(self, client, reset_activities):
+    async def test_signup_full_activity_returns_400(self, client, reset_activities):
         """Test that signup to full activity returns 400"""
         # Add participants to Math Olympiad until it's full
         max_participants = activities["Math Olympiad"]["max_participants"]
-        for i in range(max_participants):
-            activities["Math Olympiad"]["participants"].append(f"student{i}@mergington.edu")
+        activities["Math Olympiad"]["participants"].extend(
+            [f"student{i}@mergington.edu" for i in range(max_participants)]
+        )
         
-        response = client.post(
+        response = await client.post(
             "/activities/Math%20Olympiad/signup?email=newstudent@mergington.edu"
         )
         assert response.status_code == 400
@@ -139,54 +94,38 @@ class TestSignup:
 class TestUnregister:
     """Tests for POST /activities/{activity_name}/unregister endpoint"""
     
-    def test_unregister_returns_200(self, client, reset_activities):
-        """Test that unregister returns 200 status code"""
-        email = "michael@mergington.edu"
-        response = client.post(
-            f"/activities/Chess%20Club/unregister?email={email}"
-        )
-        assert response.status_code == 200
-    
-    def test_unregister_removes_participant(self, client, reset_activities):
-        """Test that unregister removes a participant"""
+    async def test_unregister_happy_path(self, client, reset_activities):
+        """Test that unregister returns 200, removes the participant and reports success"""
         email = "michael@mergington.edu"
         
         # Verify participant is in activity
-        activities_response = client.get("/activities")
-        assert email in activities_response.json()["Chess Club"]["participants"]
+        assert email in activities["Chess Club"]["participants"]
         
         # Unregister
-        response = client.post(
+        response = await client.post(
             f"/activities/Chess%20Club/unregister?email={email}"
         )
         assert response.status_code == 200
         
         # Verify participant was removed
-        activities_response = client.get("/activities")
-        assert email not in activities_response.json()["Chess Club"]["participants"]
-    
-    def test_unregister_returns_success_message(self, client, reset_activities):
-        """Test that unregister returns appropriate message"""
-        email = "michael@mergington.edu"
-        response = client.post(
-            f"/activities/Chess%20Club/unregister?email={email}"
-        )
+        assert email not in activities["Chess Club"]["participants"]
+        
         data = response.json()
         assert "message" in data
         assert email in data["message"]
         assert "Unregistered" in data["message"]
     
-    def test_unregister_nonexistent_activity_returns_404(self, client):
+    async def test_unregister_nonexistent_activity_returns_404(self, client):
         """Test that unregister from nonexistent activity returns 404"""
-        response = client.post(
+        response = await client.post(
             "/activities/Nonexistent%20Activity/unregister?email=test@mergington.edu"
         )
         assert response.status_code == 404
         assert response.json()["detail"] == "Activity not found"
     
-    def test_unregister_nonregistered_participant_returns_400(self, client, reset_activities):
+    async def test_unregister_nonregistered_participant_returns_400(self, client, reset_activities):
         """Test that unregistering non-registered participant returns 400"""
-        response = client.post(
+        response = await client.post(
             "/activities/Soccer%20Team/unregister?email=notregistered@mergington.edu"
         )
         assert response.status_code == 400
@@ -196,13 +135,13 @@ class TestUnregister:
 class TestRootRedirect:
     """Tests for GET / endpoint"""
     
-    def test_root_redirects_to_static_index(self, client):
+    async def test_root_redirects_to_static_index(self, client):
         """Test that root path redirects to /static/index.html"""
-        response = client.get("/", follow_redirects=False)
+        response = await client.get("/", follow_redirects=False)
         assert response.status_code == 307
         assert "/static/index.html" in response.headers.get("location", "")
     
-    def test_root_redirects_successfully(self, client):
-        """Test that root path can be followed to static page"""
-        response = client.get("/", follow_redirects=True)
+    async def test_static_index_is_served(self, client):
+        """Test that the redirect target is served by the static mount"""
+        response = await client.get("/static/index.html")
         assert response.status_code == 200